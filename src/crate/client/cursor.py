@@ -20,10 +20,10 @@
 # software solely pursuant to the terms of the relevant commercial agreement.
 
 from .exceptions import ProgrammingError
-from distutils.version import StrictVersion
+from itertools import islice
 import warnings
 
-BULK_INSERT_MIN_VERSION = StrictVersion("0.42.0")
+BULK_INSERT_MIN_VERSION = (0, 42, 0)
 
 
 class Cursor(object):
@@ -36,8 +36,12 @@ class Cursor(object):
     def __init__(self, connection):
         self.arraysize = 1
         self.connection = connection
+        self._supports_bulk = \
+            connection.lowest_server_version.version >= BULK_INSERT_MIN_VERSION
         self._closed = False
         self._result = None
+        self._description = None
+        self._rowcount = -1
         self.rows = None
 
     def execute(self, sql, parameters=None, bulk_parameters=None):
@@ -52,8 +56,12 @@ class Cursor(object):
 
         self._result = self.connection.client.sql(sql, parameters,
                                                   bulk_parameters)
+        self._description = None
         if "rows" in self._result:
+            self._rowcount = self._result.get("rowcount", -1)
             self.rows = iter(self._result["rows"])
+        else:
+            self._rowcount = -1
 
     def executemany(self, sql, seq_of_parameters):
         """
@@ -63,7 +71,7 @@ class Cursor(object):
         """
         row_counts = []
         durations = []
-        if self.connection.lowest_server_version >= BULK_INSERT_MIN_VERSION:
+        if self._supports_bulk:
             self.execute(sql, bulk_parameters=seq_of_parameters)
             for result in self._result.get('results', []):
                 if result.get('rowcount') > -1:
@@ -71,12 +79,20 @@ class Cursor(object):
             if self.duration > -1:
                 durations.append(self.duration)
         else:
+            if self.connection._closed:
+                raise ProgrammingError("Connection closed")
+            if self._closed:
+                raise ProgrammingError("Cursor closed")
+            client = self.connection.client
             for params in seq_of_parameters:
-                self.execute(sql, parameters=params)
-                if self.rowcount > -1:
-                    row_counts.append(self.rowcount)
-                if self.duration > -1:
-                    durations.append(self.duration)
+                self._result = result = client.sql(sql, params, None)
+                if "rows" in result:
+                    rowcount = result.get("rowcount", -1)
+                    if rowcount > -1:
+                        row_counts.append(rowcount)
+                duration = result.get("duration", -1)
+                if duration > -1:
+                    durations.append(duration)
         self._result = {
             "rowcount": sum(row_counts) if row_counts else -1,
             "duration": sum(durations) if durations else -1,
@@ -84,6 +100,8 @@ class Cursor(object):
             "cols": self._result.get("cols", []),
             "results": self._result.get("results")
         }
+        self._description = None
+        self._rowcount = self._result["rowcount"]
         self.rows = iter(self._result["rows"])
         return self._result["results"]
 
@@ -91,12 +109,9 @@ class Cursor(object):
         """
         Fetch the next row of a query result set, returning a single sequence,
         or None when no more data is available.
-        Alias for ``next()``.
         """
-        try:
-            return self.next()
-        except StopIteration:
-            return None
+        self._check_result()
+        return next(self.rows, None)
 
     def __iter__(self):
         """
@@ -119,13 +134,8 @@ class Cursor(object):
             count = self.arraysize
         if count == 0:
             return self.fetchall()
-        result = []
-        for i in range(count):
-            try:
-                result.append(self.next())
-            except StopIteration:
-                pass
-        return result
+        self._check_result()
+        return list(islice(self.rows, count))
 
     def fetchall(self):
         """
@@ -133,14 +143,8 @@ class Cursor(object):
         sequence of sequences (e.g. a list of tuples). Note that the cursor's
         arraysize attribute can affect the performance of this operation.
         """
-        result = []
-        iterate = True
-        while iterate:
-            try:
-                result.append(self.next())
-            except StopIteration:
-                iterate = False
-        return result
+        self._check_result()
+        return list(self.rows)
 
     def close(self):
         """
@@ -168,25 +172,31 @@ class Cursor(object):
         .execute*() produced (for DQL statements like ``SELECT``) or affected
         (for DML statements like ``UPDATE`` or ``INSERT``).
         """
-        if (self._closed or not self._result or "rows" not in self._result):
+        if self._closed or not self._result:
             return -1
-        return self._result.get("rowcount", -1)
+        return self._rowcount
 
-    def next(self):
+    def _check_result(self):
         """
-        Return the next row of a query result set, respecting if cursor was
-        closed.
+        Raise if no result is available or the cursor was closed.
         """
         if self.rows is None:
             raise ProgrammingError(
                 "No result available. " +
                 "execute() or executemany() must be called first."
             )
-        elif not self._closed:
-            return next(self.rows)
-        else:
+        if self._closed:
             raise ProgrammingError("Cursor closed")
 
+    def next(self):
+        """
+        Return the next row of a query result set, respecting if cursor was
+        closed.
+        """
+        if not self._closed and self.rows is not None:
+            return next(self.rows)
+        self._check_result()
+
     __next__ = next
 
     @property
@@ -196,17 +206,12 @@ class Cursor(object):
         """
         if self._closed:
             return
-
-        description = []
-        for col in self._result["cols"]:
-            description.append((col,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None))
-        return tuple(description)
+        if self._description is None:
+            self._description = tuple(
+                (col, None, None, None, None, None, None)
+                for col in self._result["cols"]
+            )
+        return self._description
 
     @property
     def duration(self):
@@ -96,6 +96,9 @@ class CrateJsonEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
 
 
+_json_encoder = CrateJsonEncoder()
+
+
 class Server(object):
 
     def __init__(self, server, **pool_kw):
@@ -147,6 +150,7 @@ class Server(object):
         if schema is not None:
             headers['Default-Schema'] = schema
         headers['Accept'] = 'application/json'
+        headers['Accept-Encoding'] = 'gzip, deflate'
         headers['Content-Type'] = 'application/json'
         kwargs['assert_same_host'] = False
         kwargs['redirect'] = False
@@ -280,7 +284,7 @@ def _create_sql_payload(stmt, args, bulk_args):
         data['args'] = args
     if bulk_args:
         data['bulk_args'] = bulk_args
-    return json.dumps(data, cls=CrateJsonEncoder)
+    return _json_encoder.encode(data)
 
 
 def _get_socket_opts(keepalive=True,